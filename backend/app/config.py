@@ -12,6 +12,31 @@ class Settings:
     MODEL_PATH = ARTIFACTS_DIR / "lgbm_tuned_model.pkl"
     SCALER_PATH = ARTIFACTS_DIR / "robust_scaler.pkl"
     
+    # Decision Threshold (P(Severe) >= threshold -> 'Severe')
+    DECISION_THRESHOLD = 0.5
+    
+    # Multi-Model Mode: Champion serves, Challengers are shadow-scored
+    MULTI_MODEL_MODE = os.getenv("MULTI_MODEL_MODE", "false").lower() == "true"
+    CHALLENGER_MODELS = {
+        "catboost": ARTIFACTS_DIR / "catboost_model.cbm",
+    }
+    CHALLENGER_WORKERS = 1          # Worker processes in the challenger pool
+    CHALLENGER_NICE = 19            # Worker CPU priority increment (19 = lowest)
+    CHALLENGER_MAX_PENDING = 256    # Queued requests before challengers shed load
+    CHALLENGER_SAMPLE_RATE = float(os.getenv("CHALLENGER_SAMPLE_RATE", "1.0"))  # Share of requests shadow-scored
+    STATS_WINDOW = 10000            # Latency samples kept per model
+    
+    # Fast-Path Model (built by backend/create_fast_model.py)
+    # Scores with a truncated booster; probabilities within FAST_MODEL_BAND
+    # of DECISION_THRESHOLD are re-scored by the full model.
+    FAST_MODEL_ENABLED = os.getenv("FAST_MODEL_ENABLED", "false").lower() == "true"
+    FAST_MODEL_PATH = ARTIFACTS_DIR / "lgbm_fast_model.txt"
+    FAST_MODEL_BAND = float(os.getenv("FAST_MODEL_BAND", "0.1"))
+    FAST_MODEL_REPORT_PATH = ARTIFACTS_DIR / "fast_model_report.md"
+    
+    # Compact Input (POST /predict/compact)
+    COMPACT_MAX_BATCH = 1024  # Max records per request body
+    
     # App Settings
     APP_NAME = "US Accident Severity Prediction API"
     VERSION = "1.0.0"
@@ -1,17 +1,19 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from starlette.concurrency import run_in_threadpool
 import time
 import uvicorn
 import numpy as np
 import os
 
 # Internal Imports
-from .schemas import AccidentInput, PredictionOutput
+from .schemas import AccidentInput, PredictionOutput, CompactPredictionOutput
 from .config import settings
 from .services.model_loader import ModelLoader
 from .services.feature_engineering import feature_engine
+from .services.compact_input import compact_decoder, MAX_BODY_BYTES
 
 # 1. Initialize App (Security: Disable Docs in Prod)
 # We disable /docs and /redoc to prevent attackers from easily mapping the API
@@ -74,6 +76,13 @@ async def startup_event():
         # In production, you might want to force exit here if models fail
         # raise e
 
+@app.on_event("shutdown")
+def shutdown_event():
+    """
+    Drain queued challenger scoring before the process exits.
+    """
+    ModelLoader.shutdown_challengers(wait=True)
+
 # 5. Health Check & Root
 @app.get("/")
 def root():
@@ -81,16 +90,28 @@ def root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy", "model_loaded": ModelLoader._model is not None}
+    return {
+        "status": "healthy",
+        "model_loaded": ModelLoader._model is not None,
+        "challengers_loaded": list(ModelLoader._challengers)
+    }
+
+@app.get("/models/stats")
+def model_stats():
+    """
+    Champion latency plus challenger agreement rates and latency (Multi-Model Mode).
+    """
+    return ModelLoader.get_stats()
 
 # 6. Prediction Endpoint
 @app.post("/predict", response_model=PredictionOutput)
-def predict_severity(input_data: AccidentInput):
+def predict_severity(input_data: AccidentInput, background_tasks: BackgroundTasks):
     """
     Main inference endpoint.
     1. Validates input (Pydantic)
     2. Transforms features (FeatureEngineer)
     3. Predicts probability (LightGBM)
+    4. Shadow-scores challengers after the response is sent (Multi-Model Mode)
     """
     start_time = time.time()
     
@@ -105,13 +126,18 @@ def predict_severity(input_data: AccidentInput):
         features = feature_engine.transform(input_data)
         
         # C. Inference
-        # predict_proba returns [[prob_0, prob_1]] -> We want prob_1 (Severe)
-        probs = model.predict_proba(features)
-        severe_prob = float(probs[0][1])
+        # P(Severe) per row (fast path + full-model fallback when enabled)
+        infer_start = time.perf_counter()
+        severe_probs = ModelLoader.predict_severe(features)
+        ModelLoader.record_champion((time.perf_counter() - infer_start) * 1000)
+        severe_prob = float(severe_probs[0])
         
         # D. Logic for Label
-        # Using 0.5 as threshold, but this can be tuned via 'settings' later
-        label = "Severe" if severe_prob >= 0.5 else "Minor"
+        label = "Severe" if severe_prob >= settings.DECISION_THRESHOLD else "Minor"
+
+        # Challengers reuse the same engineered features, off the critical path
+        if ModelLoader._challengers:
+            background_tasks.add_task(ModelLoader.submit_challengers, features, severe_probs)
         
         # E. Response
         processing_time = (time.time() - start_time) * 1000 # ms
@@ -128,6 +154,69 @@ def predict_severity(input_data: AccidentInput):
         # Return a generic, safe error to the client
         raise HTTPException(status_code=500, detail="Internal Processing Error. Please try again.")
 
+# 7. Compact Batch Endpoint (High-Rate Machine Clients)
+def _predict_compact(body: bytes, background_tasks: BackgroundTasks) -> CompactPredictionOutput:
+    start_time = time.time()
+
+    model = ModelLoader.get_model()
+    if not model:
+        raise HTTPException(status_code=503, detail="Model not loaded")
+
+    # Bytes -> Records, no JSON / Pydantic per record
+    try:
+        records = compact_decoder.decode(body)
+    except ValueError as e:
+        # Range check failures are the client's fault and safe to echo
+        raise HTTPException(status_code=422, detail=f"Invalid compact body: {e}")
+
+    # Records -> Numpy Array (N, 54). Errors here are internal (generic 500)
+    features = compact_decoder.transform_records(records)
+
+    infer_start = time.perf_counter()
+    severe_probs = ModelLoader.predict_severe(features)
+    ModelLoader.record_champion((time.perf_counter() - infer_start) * 1000, len(severe_probs), endpoint="/predict/compact")
+    labels = np.where(severe_probs >= settings.DECISION_THRESHOLD, "Severe", "Minor")
+
+    if ModelLoader._challengers:
+        background_tasks.add_task(ModelLoader.submit_challengers, features, severe_probs)
+
+    processing_time = (time.time() - start_time) * 1000 # ms
+
+    return CompactPredictionOutput(
+        severity_probabilities=severe_probs.tolist(),
+        prediction_labels=labels.tolist(),
+        processing_time_ms=round(processing_time, 2)
+    )
+
+@app.post("/predict/compact", response_model=CompactPredictionOutput)
+async def predict_severity_compact(request: Request, background_tasks: BackgroundTasks):
+    """
+    Batch inference over packed binary records (see services/compact_input.py).
+    Returns the same probabilities as /predict, in request order.
+    """
+    # Enforce the batch limit before buffering the body
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_BODY_BYTES:
+        raise HTTPException(status_code=413, detail=f"Body exceeds {MAX_BODY_BYTES} bytes")
+
+    # Stream with a byte cap (covers chunked bodies without Content-Length)
+    chunks, size = [], 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise HTTPException(status_code=413, detail=f"Body exceeds {MAX_BODY_BYTES} bytes")
+        chunks.append(chunk)
+    body = b"".join(chunks)
+
+    try:
+        # Run CPU-bound work off the event loop (same as sync endpoints)
+        return await run_in_threadpool(_predict_compact, body, background_tasks)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"CRITICAL PROCESSING ERROR: {e}")
+        raise HTTPException(status_code=500, detail="Internal Processing Error. Please try again.")
+
 if __name__ == "__main__":
     # Local Dev Run
     port = int(os.getenv("PORT", 8000))
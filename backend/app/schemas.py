@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 class AccidentInput(BaseModel):
     # --- 1. DateTime (Crucial for Cyclical Features) ---
@@ -67,3 +67,8 @@ class PredictionOutput(BaseModel):
     severity_probability: float = Field(..., description="Probability of the accident being Severe (Class 1)")
     prediction_label: str = Field(..., description="Text label: 'Severe' or 'Minor'")
     processing_time_ms: float = Field(..., description="Time taken to process request")
+
+class CompactPredictionOutput(BaseModel):
+    severity_probabilities: List[float] = Field(..., description="Probability of Severe (Class 1), one per record in request order")
+    prediction_labels: List[str] = Field(..., description="Text labels ('Severe' or 'Minor'), one per record")
+    processing_time_ms: float = Field(..., description="Time taken to process the whole batch")
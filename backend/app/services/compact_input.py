@@ -0,0 +1,208 @@
+import re
+import numpy as np
+from typing import List
+from ..config import settings
+from ..schemas import AccidentInput
+from .feature_engineering import FeatureEngineer
+from .model_loader import ModelLoader
+
+# --- Compact Record Schema (Fixed 256-byte, little-endian) ---
+# One record per accident; a request body is N records concatenated back to back.
+#
+#   offset  field           type    notes
+#   0       start_time      int64   Wall-clock Start_Time as seconds since 1970-01-01 (no timezone shift), years 1-9999
+#   8       temperature     float64 Temperature(F)
+#   16      humidity        float64 Humidity(%)
+#   24      pressure        float64 Pressure(in)
+#   32      visibility      float64 Visibility(mi)
+#   40      wind_speed      float64 Wind_Speed(mph)
+#   48      precipitation   float64 Precipitation(in), must be >= 0
+#   56      weather         uint8   Index into WEATHER_CODES
+#   57      wind_direction  uint8   Index into WIND_DIRECTION_CODES
+#   58      poi_flags       uint16  Bit i set = FeatureEngineer.POI_COLS[i] is True
+#   60      description     bytes   UTF-8 Description, NUL padded, at most 196 bytes (longer is rejected)
+COMPACT_DTYPE = np.dtype([
+    ('start_time', '<i8'),
+    ('temperature', '<f8'),
+    ('humidity', '<f8'),
+    ('pressure', '<f8'),
+    ('visibility', '<f8'),
+    ('wind_speed', '<f8'),
+    ('precipitation', '<f8'),
+    ('weather', 'u1'),
+    ('wind_direction', 'u1'),
+    ('poi_flags', '<u2'),
+    ('description', 'S196'),
+])
+
+# Categorical codes (Order is part of the wire format - append only!)
+WEATHER_CODES = ('Clear', 'Cloudy', 'Fog/Obscured', 'Rain', 'Snow/Ice', 'Storm')
+# Code 0 covers 'Calm' and any direction unknown to the scaler (all dummies 0)
+WIND_DIRECTION_CODES = ('Calm', 'E', 'ENE', 'ESE', 'N', 'NE', 'NNE', 'NNW', 'NW',
+                        'S', 'SE', 'SSE', 'SSW', 'SW', 'VAR', 'W', 'WNW', 'WSW')
+
+# Largest body the endpoint will read
+MAX_BODY_BYTES = settings.COMPACT_MAX_BATCH * COMPACT_DTYPE.itemsize
+
+# Same range as Python's datetime (years 1-9999); also excludes NaT (INT64_MIN)
+_MIN_START_TIME = np.datetime64('0001-01-01T00:00:00', 's').astype(np.int64)
+_MAX_START_TIME = np.datetime64('9999-12-31T23:59:59', 's').astype(np.int64)
+
+_NUMERIC_FIELDS = {
+    'Temperature(F)': 'temperature',
+    'Humidity(%)': 'humidity',
+    'Pressure(in)': 'pressure',
+    'Visibility(mi)': 'visibility',
+    'Wind_Speed(mph)': 'wind_speed',
+}
+
+
+def encode_records(inputs: List[AccidentInput]) -> bytes:
+    """
+    Client-side helper: packs validated AccidentInput objects into a compact body.
+    Raises ValueError if a Description does not fit the fixed-width field, since
+    truncating it could change the keyword flags vs the JSON path.
+    """
+    records = np.zeros(len(inputs), dtype=COMPACT_DTYPE)
+    desc_width = COMPACT_DTYPE['description'].itemsize
+    for i, item in enumerate(inputs):
+        data = item.dict(by_alias=True)
+        desc = item.Description.encode('utf-8')
+        if len(desc) > desc_width:
+            raise ValueError(f"Record {i}: Description is {len(desc)} bytes, compact limit is {desc_width}")
+        start = np.datetime64(item.Start_Time.replace(tzinfo=None), 's').astype(np.int64)
+
+        weather = WEATHER_CODES.index(FeatureEngineer.simplify_weather(item.Weather_Condition))
+        wd = item.Wind_Direction.upper()
+        wind = WIND_DIRECTION_CODES.index(wd) if wd in WIND_DIRECTION_CODES[1:] else 0
+
+        flags = 0
+        for bit, col in enumerate(FeatureEngineer.POI_COLS):
+            if data.get(col, False):
+                flags |= 1 << bit
+
+        records[i] = (
+            start,
+            *(data[alias] for alias in _NUMERIC_FIELDS),
+            data['Precipitation(in)'],
+            weather,
+            wind,
+            flags,
+            desc,
+        )
+    return records.tobytes()
+
+
+class CompactDecoder:
+    """
+    Decodes compact record batches straight into the scaled model matrix,
+    skipping JSON parsing and per-field Pydantic validation.
+    """
+    _col = {name: i for i, name in enumerate(FeatureEngineer.FEATURE_ORDER)}
+    # (Column Index, Compiled Regex) per Description keyword flag
+    _desc_patterns = [
+        (FeatureEngineer.FEATURE_ORDER.index(key), re.compile(pattern))
+        for key, pattern in FeatureEngineer.DESC_KEYWORDS.items()
+    ]
+    # Code -> Column Index lookups (Code 0 is the dropped baseline, never indexed)
+    _weather_cols = np.array([-1] + [FeatureEngineer.FEATURE_ORDER.index(f"Weather_Simplified_{w}") for w in WEATHER_CODES[1:]])
+    _wind_cols = np.array([-1] + [FeatureEngineer.FEATURE_ORDER.index(f"Wind_Direction_{wd}") for wd in WIND_DIRECTION_CODES[1:]])
+
+    def decode(self, body: bytes) -> np.ndarray:
+        """
+        Raw bytes -> structured record array, with vectorized range checks.
+        Raises ValueError describing the first offending check.
+        """
+        if not body or len(body) % COMPACT_DTYPE.itemsize != 0:
+            raise ValueError(f"Body must be a non-empty multiple of {COMPACT_DTYPE.itemsize} bytes")
+        records = np.frombuffer(body, dtype=COMPACT_DTYPE)
+        if len(records) > settings.COMPACT_MAX_BATCH:
+            raise ValueError(f"Batch exceeds {settings.COMPACT_MAX_BATCH} records")
+
+        start_time = records['start_time']
+        if ((start_time < _MIN_START_TIME) | (start_time > _MAX_START_TIME)).any():
+            raise ValueError("start_time out of range (years 1-9999)")
+        numerics = np.stack([records[f] for f in _NUMERIC_FIELDS.values()] + [records['precipitation']], axis=1)
+        if not np.isfinite(numerics).all():
+            raise ValueError("Numeric fields must be finite")
+        if (records['precipitation'] < 0).any():
+            raise ValueError("precipitation must be >= 0")
+        if (records['weather'] >= len(WEATHER_CODES)).any():
+            raise ValueError("weather code out of range")
+        if (records['wind_direction'] >= len(WIND_DIRECTION_CODES)).any():
+            raise ValueError("wind_direction code out of range")
+        if (records['poi_flags'] >> len(FeatureEngineer.POI_COLS)).any():
+            raise ValueError("poi_flags has unknown bits set")
+        for i, raw in enumerate(records['description']):
+            try:
+                raw.decode('utf-8')
+            except UnicodeDecodeError:
+                raise ValueError(f"Record {i}: description is not valid UTF-8")
+        return records
+
+    def transform(self, body: bytes) -> np.ndarray:
+        """
+        Main pipeline: Compact Bytes -> Scaled Numpy Array (N, 54)
+        """
+        return self.transform_records(self.decode(body))
+
+    def transform_records(self, records: np.ndarray) -> np.ndarray:
+        """
+        Decoded records -> Scaled Numpy Array (N, 54)
+        Mirrors FeatureEngineer.transform column for column.
+        """
+        col = self._col
+        X = np.zeros((len(records), len(FeatureEngineer.FEATURE_ORDER)))
+
+        # 1. Base Numerics
+        for alias, field in _NUMERIC_FIELDS.items():
+            X[:, col[alias]] = records[field]
+
+        # 2. Wind Chill (only valid if T < 50F and V > 3mph)
+        T = records['temperature']
+        V = records['wind_speed']
+        with np.errstate(invalid='ignore'):
+            chill = 35.74 + (0.6215 * T) - (35.75 * (V ** 0.16)) + (0.4275 * T * (V ** 0.16))
+        X[:, col['Wind_Chill(F)']] = np.where((T < 50) & (V > 3), chill, T)
+
+        # 3. Time Features
+        ts = records['start_time'].astype('datetime64[s]')
+        hour = (ts - ts.astype('datetime64[D]')) // np.timedelta64(1, 'h')
+        month = ts.astype('datetime64[M]').astype(np.int64) % 12 + 1
+        X[:, col['Hour_Sin']] = np.sin(2 * np.pi * hour / 24)
+        X[:, col['Hour_Cos']] = np.cos(2 * np.pi * hour / 24)
+        X[:, col['Month_Sin']] = np.sin(2 * np.pi * month / 12)
+        X[:, col['Month_Cos']] = np.cos(2 * np.pi * month / 12)
+        X[:, col['Is_Night']] = (hour >= 18) | (hour < 6)
+
+        # 4. Text Features (Regex, plain loop: no fixed per-call overhead)
+        for i, raw in enumerate(records['description']):
+            desc = raw.decode('utf-8').lower()
+            for j, pattern in self._desc_patterns:
+                if pattern.search(desc):
+                    X[i, j] = 1
+
+        # 5. Log Precipitation
+        X[:, col['Log_Precipitation(in)']] = np.log1p(records['precipitation'])
+
+        # 6. Categorical One-Hot (Code 0 is the dropped baseline for both)
+        rows = np.arange(len(records))
+        for codes, lookup in ((records['weather'], self._weather_cols), (records['wind_direction'], self._wind_cols)):
+            active = codes > 0
+            X[rows[active], lookup[codes[active]]] = 1
+
+        # 7. POI Bitmask
+        for bit, p in enumerate(FeatureEngineer.POI_COLS):
+            X[:, col[p]] = (records['poi_flags'] >> bit) & 1
+
+        # 8. Scale
+        # RobustScaler.transform is (X - center_) / scale_; applying it directly
+        # skips sklearn's per-call input validation (same arithmetic, same result)
+        scaler = ModelLoader.get_scaler()
+        if scaler.with_centering:
+            X -= scaler.center_
+        if scaler.with_scaling:
+            X /= scaler.scale_
+        return X
+
+compact_decoder = CompactDecoder()
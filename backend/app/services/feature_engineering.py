@@ -20,6 +20,34 @@ class FeatureEngineer:
         'Wind_Direction_SW', 'Wind_Direction_VAR', 'Wind_Direction_W', 'Wind_Direction_WNW', 'Wind_Direction_WSW'
     ]
 
+    # Regex keyword flags derived from the free-text Description
+    DESC_KEYWORDS = {
+        'Desc_Queue': r'\b(queue|backups?|slow|stationary|stop|waiting|delays?)\b',
+        'Desc_Heavy': r'\b(heavy|congestion|gridlock|bumper)\b',
+        'Desc_Blocked': r'\b(block|close|lane|closed|shut|down)\b',
+        'Desc_Ramp': r'\b(ramp|exit|entry|interchange)\b',
+        'Desc_Accident': r'\b(accident|crash|collision|incident)\b',
+        'Desc_Hazard': r'\b(hazard|debris|object|spill|obstacle|animal)\b',
+        'Desc_Caution': r'\b(caution|care|alert|warning)\b',
+        'Desc_Fire': r'\b(fire|smoke|flame|burn)\b'
+    }
+
+    # Points of Interest (Bump is dropped by the scaler)
+    POI_COLS = ['Amenity', 'Crossing', 'Give_Way', 'Junction', 'No_Exit', 'Railway', 'Roundabout', 'Station', 'Stop', 'Traffic_Calming', 'Traffic_Signal', 'Turning_Loop']
+
+    @staticmethod
+    def simplify_weather(weather_condition: str) -> str:
+        """
+        Collapses a raw Weather_Condition into one of the 6 training categories.
+        """
+        w = weather_condition.lower()
+        if any(x in w for x in ['snow', 'sleet', 'ice', 'freezing', 'wintry', 'hail']): return 'Snow/Ice'
+        if any(x in w for x in ['thunder', 't-storm', 'tornado', 'squall']): return 'Storm'
+        if any(x in w for x in ['rain', 'drizzle', 'shower']): return 'Rain'
+        if any(x in w for x in ['fog', 'mist', 'haze', 'smoke', 'dust', 'sand']): return 'Fog/Obscured'
+        if any(x in w for x in ['cloudy', 'overcast']): return 'Cloudy'
+        return 'Clear'
+
     def transform(self, input_data: AccidentInput) -> np.ndarray:
         """
         Main pipeline: Input Schema -> Scaled Numpy Array (1, 54)
@@ -53,17 +81,7 @@ class FeatureEngineer:
 
         # 4. Text Features (Regex)
         desc = input_data.Description.lower()
-        keywords = {
-            'Desc_Queue': r'\b(queue|backups?|slow|stationary|stop|waiting|delays?)\b',
-            'Desc_Heavy': r'\b(heavy|congestion|gridlock|bumper)\b',
-            'Desc_Blocked': r'\b(block|close|lane|closed|shut|down)\b',
-            'Desc_Ramp': r'\b(ramp|exit|entry|interchange)\b',
-            'Desc_Accident': r'\b(accident|crash|collision|incident)\b',
-            'Desc_Hazard': r'\b(hazard|debris|object|spill|obstacle|animal)\b',
-            'Desc_Caution': r'\b(caution|care|alert|warning)\b',
-            'Desc_Fire': r'\b(fire|smoke|flame|burn)\b'
-        }
-        for key, pattern in keywords.items():
+        for key, pattern in self.DESC_KEYWORDS.items():
             data[key] = 1 if re.search(pattern, desc) else 0
 
         # 5. Log Precipitation
@@ -72,13 +90,7 @@ class FeatureEngineer:
 
         # 6. Categorical One-Hot Encoding (Manual Alignment)
         # A. Weather
-        w = input_data.Weather_Condition.lower()
-        simple_w = 'Clear' # Default
-        if any(x in w for x in ['snow', 'sleet', 'ice', 'freezing', 'wintry', 'hail']): simple_w = 'Snow/Ice'
-        elif any(x in w for x in ['thunder', 't-storm', 'tornado', 'squall']): simple_w = 'Storm'
-        elif any(x in w for x in ['rain', 'drizzle', 'shower']): simple_w = 'Rain'
-        elif any(x in w for x in ['fog', 'mist', 'haze', 'smoke', 'dust', 'sand']): simple_w = 'Fog/Obscured'
-        elif any(x in w for x in ['cloudy', 'overcast']): simple_w = 'Cloudy'
+        simple_w = self.simplify_weather(input_data.Weather_Condition)
         
         # Set all Weather_Simplified_* to 0
         for feat in self.FEATURE_ORDER:
@@ -102,8 +114,7 @@ class FeatureEngineer:
         
         # 7. Boolean Casting (POI)
         # Ensure Schema bools become ints
-        poi_cols = ['Amenity', 'Crossing', 'Give_Way', 'Junction', 'No_Exit', 'Railway', 'Roundabout', 'Station', 'Stop', 'Traffic_Calming', 'Traffic_Signal', 'Turning_Loop']
-        for p in poi_cols:
+        for p in self.POI_COLS:
             data[p] = 1 if data.get(p, False) else 0
 
         # 8. Assemble Vector (Strict Order)
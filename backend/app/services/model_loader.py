@@ -1,12 +1,125 @@
 import joblib
+import json
+import pickle
 import pandas as pd
+import numpy as np
+import multiprocessing
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from ..config import settings
 import os
 
+class ModelStats:
+    """
+    Thread-safe rolling latency and agreement counters for one model.
+    """
+    def __init__(self, window: int):
+        self._lock = threading.Lock()
+        self._latencies_ms = deque(maxlen=window)
+        self.scored = 0   # Records scored
+        self.agreed = 0   # Records whose label matched the champion
+        self.dropped = 0  # Requests skipped because the challenger queue was full
+
+    def record(self, latency_ms: float, n: int = 1, agreed: int = None):
+        with self._lock:
+            self._latencies_ms.append(latency_ms)
+            self.scored += n
+            if agreed is not None:
+                self.agreed += agreed
+
+    def record_drop(self):
+        with self._lock:
+            self.dropped += 1
+
+    def summary(self, is_champion: bool = False) -> dict:
+        with self._lock:
+            lat = np.array(self._latencies_ms)
+            out = {
+                "scored": self.scored,
+                "latency_p50_ms": round(float(np.percentile(lat, 50)), 3) if len(lat) else None,
+                "latency_p99_ms": round(float(np.percentile(lat, 99)), 3) if len(lat) else None,
+            }
+            if not is_champion:
+                out["agreement_rate"] = round(self.agreed / self.scored, 4) if self.scored else None
+                out["dropped"] = self.dropped
+            return out
+
+# Challengers are scored with one thread so they cannot starve the champion's cores
+_SINGLE_THREAD_KWARGS = {
+    "LGBMClassifier": {"num_threads": 1},
+    "CatBoostClassifier": {"thread_count": 1},
+}
+
+def _full_predict(model, features: np.ndarray, **kwargs) -> np.ndarray:
+    """
+    P(Severe) from the full champion. Calls the raw LightGBM booster when available:
+    same values as predict_proba(...)[:, 1] without the sklearn wrapper overhead.
+    """
+    booster = getattr(model, "booster_", None)
+    if booster is not None:
+        return booster.predict(features, **kwargs)
+    return model.predict_proba(features)[:, 1]
+
+# --- Challenger Worker Process ---
+# Challengers run in separate, low-priority processes so they never hold the
+# serving process's GIL. Each worker keeps its own copy of the models.
+_worker_challengers = {}
+_worker_champion = None
+
+def _init_challenger_worker(models_blob: bytes, nice: int):
+    global _worker_challengers, _worker_champion
+    # Drop priority first so even the model unpickling (and library imports)
+    # only use CPU the serving process leaves idle
+    if nice and hasattr(os, "nice"):
+        os.nice(nice)
+    _worker_champion, _worker_challengers = pickle.loads(models_blob)
+
+def _worker_ready() -> bool:
+    return True
+
+def _score_in_worker(features: np.ndarray, champion_labels: np.ndarray = None) -> list:
+    """
+    Scores every challenger. Returns (name, latency_ms, n_records, n_agreed) per model.
+    champion_labels=None means the served labels came (partly) from the fast path,
+    so the full champion is re-scored here to keep agreement against the champion.
+    """
+    if champion_labels is None:
+        champion_labels = _full_predict(_worker_champion, features, num_threads=1) >= settings.DECISION_THRESHOLD
+    results = []
+    for name, model in _worker_challengers.items():
+        try:
+            kwargs = _SINGLE_THREAD_KWARGS.get(type(model).__name__, {})
+            start = time.perf_counter()
+            probs = model.predict_proba(features, **kwargs)[:, 1]
+            latency = (time.perf_counter() - start) * 1000 # ms
+            agreed = int(((probs >= settings.DECISION_THRESHOLD) == champion_labels).sum())
+            results.append((name, latency, len(probs), agreed))
+        except Exception as e:
+            print(f"CHALLENGER ERROR ({name}): {e}")
+    return results
+
 class ModelLoader:
     _model = None
     _scaler = None
 
+    # Fast-Path Model (Truncated LightGBM Booster)
+    _fast_model = None
+    _fast_records = 0
+    _fast_fallbacks = 0
+    _fast_lock = threading.Lock()
+
+    # Multi-Model Mode (Champion / Challengers)
+    _challengers = {}      # Replaced, never mutated, so readers can iterate safely
+    _stats = {}            # Challenger name -> ModelStats
+    _champion_stats = {}   # Endpoint -> ModelStats (batch and single-row kept apart)
+    _executor = None
+    _pending = 0
+    _pending_lock = threading.Lock()
+    _challenger_lock = threading.Lock()
+
     @classmethod
     def load_models(cls):
         """
@@ -25,7 +138,92 @@ class ModelLoader:
             cls._model = joblib.load(settings.MODEL_PATH)
             cls._scaler = joblib.load(settings.SCALER_PATH)
             print("Artifacts loaded successfully.")
-    
+
+            if settings.FAST_MODEL_ENABLED:
+                cls.load_fast_model()
+
+            if settings.MULTI_MODEL_MODE:
+                cls.load_challengers()
+
+    @classmethod
+    def load_fast_model(cls):
+        """
+        Loads the fast-path booster. If missing, the full model serves every request.
+        """
+        if not os.path.exists(settings.FAST_MODEL_PATH):
+            print(f"WARNING: Fast model not found at {settings.FAST_MODEL_PATH}. Using full model only.")
+            return
+        import lightgbm as lgb
+        print(f"Loading Fast Model from: {settings.FAST_MODEL_PATH}")
+        cls._fast_model = lgb.Booster(model_file=str(settings.FAST_MODEL_PATH))
+
+        # The report's recall only holds for the band/threshold it was measured with
+        report_path = settings.FAST_MODEL_REPORT_PATH.with_suffix(".json")
+        if os.path.exists(report_path):
+            with open(report_path) as f:
+                report = json.load(f)
+            if (report.get("fast_model_band") != settings.FAST_MODEL_BAND
+                    or report.get("decision_threshold") != settings.DECISION_THRESHOLD):
+                print(f"WARNING: Fast model was selected with band {report.get('fast_model_band')} / "
+                      f"threshold {report.get('decision_threshold')}, serving with "
+                      f"{settings.FAST_MODEL_BAND} / {settings.DECISION_THRESHOLD}. Reported recall does not apply.")
+
+    @classmethod
+    def load_challengers(cls):
+        """
+        Loads challenger models listed in settings.CHALLENGER_MODELS.
+        Missing files are skipped so the champion can still serve.
+        Returns the number of challengers registered.
+        """
+        for name, path in settings.CHALLENGER_MODELS.items():
+            if not os.path.exists(path):
+                print(f"WARNING: Challenger '{name}' not found at {path}. Skipping.")
+                continue
+            print(f"Loading Challenger '{name}' from: {path}")
+            if str(path).endswith(".cbm"):
+                # Native CatBoost format (as written by catboost_info runs)
+                from catboost import CatBoostClassifier
+                model = CatBoostClassifier()
+                model.load_model(str(path))
+            else:
+                model = joblib.load(path)
+            cls.add_challenger(name, model)
+        return len(cls._challengers)
+
+    @classmethod
+    def add_challenger(cls, name: str, model):
+        """
+        Registers an in-memory challenger and (re)starts the challenger worker pool,
+        since each worker process holds its own copy of the challenger set.
+        """
+        with cls._challenger_lock:
+            cls._stats[name] = ModelStats(settings.STATS_WINDOW)
+            cls._challengers = {**cls._challengers, name: model}
+            old_executor = cls._executor
+            cls._executor = ProcessPoolExecutor(
+                max_workers=settings.CHALLENGER_WORKERS,
+                # spawn: never fork a process that already runs server/OpenMP threads
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_challenger_worker,
+                initargs=(pickle.dumps((cls.get_model(), cls._challengers)), settings.CHALLENGER_NICE)
+            )
+            # Warm up now (startup), not lazily on the first live request
+            warmups = [cls._executor.submit(_worker_ready) for _ in range(settings.CHALLENGER_WORKERS)]
+        for future in warmups:
+            future.result()
+        if old_executor is not None:
+            old_executor.shutdown(wait=True)
+
+    @classmethod
+    def shutdown_challengers(cls, wait: bool = True):
+        """
+        Stops the challenger pool (optionally draining queued scoring first).
+        """
+        with cls._challenger_lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
     @classmethod
     def get_model(cls):
         if cls._model is None:
@@ -37,3 +235,104 @@ class ModelLoader:
         if cls._scaler is None:
             cls.load_models()
         return cls._scaler
+
+    @classmethod
+    def predict_severe(cls, features: np.ndarray) -> np.ndarray:
+        """
+        Returns P(Severe) per row. With the fast model loaded, only rows whose
+        fast probability is borderline (within FAST_MODEL_BAND of the threshold)
+        are re-scored by the full model.
+        """
+        model = cls.get_model()
+        if cls._fast_model is None:
+            return _full_predict(model, features)
+
+        # Booster.predict returns P(class 1) directly for binary objectives
+        probs = cls._fast_model.predict(features)
+        borderline = np.abs(probs - settings.DECISION_THRESHOLD) < settings.FAST_MODEL_BAND
+        if borderline.any():
+            probs[borderline] = _full_predict(model, features[borderline])
+
+        with cls._fast_lock:
+            cls._fast_records += len(probs)
+            cls._fast_fallbacks += int(borderline.sum())
+        return probs
+
+    @classmethod
+    def record_champion(cls, latency_ms: float, n: int = 1, endpoint: str = "/predict"):
+        """
+        Records one champion call. Kept per endpoint so a 1024-row compact batch
+        never lands in the same latency window as a single-row /predict.
+        """
+        stats = cls._champion_stats.get(endpoint)
+        if stats is None:
+            with cls._challenger_lock:
+                stats = cls._champion_stats.setdefault(endpoint, ModelStats(settings.STATS_WINDOW))
+        stats.record(latency_ms, n)
+
+    @classmethod
+    def submit_challengers(cls, features: np.ndarray, champion_probs: np.ndarray):
+        """
+        Queues challenger scoring on the challenger pool and returns immediately.
+        Meant to run as a background task, i.e. after the champion response is sent.
+        """
+        challengers = cls._challengers
+        if not challengers:
+            return
+        if settings.CHALLENGER_SAMPLE_RATE < 1.0 and random.random() >= settings.CHALLENGER_SAMPLE_RATE:
+            return
+        with cls._pending_lock:
+            if cls._pending >= settings.CHALLENGER_MAX_PENDING:
+                # Shed load rather than let the backlog grow
+                for name in challengers:
+                    cls._stats[name].record_drop()
+                return
+            cls._pending += 1
+
+        # Agreement is always against the full champion: fast-path probabilities
+        # are not passed on, the worker re-scores the champion instead
+        champion_labels = None if cls._fast_model is not None else champion_probs >= settings.DECISION_THRESHOLD
+        try:
+            future = cls._executor.submit(_score_in_worker, features, champion_labels)
+        except Exception as e:
+            # Pool shut down (None / RuntimeError) between the check and the submit
+            with cls._pending_lock:
+                cls._pending -= 1
+            print(f"CHALLENGER SUBMIT SKIPPED: {e}")
+            return
+        future.add_done_callback(cls._record_challenger_results)
+
+    @classmethod
+    def _record_challenger_results(cls, future):
+        try:
+            if not future.cancelled():
+                for name, latency, n, agreed in future.result():
+                    stats = cls._stats.get(name)
+                    if stats is not None:
+                        stats.record(latency, n, agreed)
+        except Exception as e:
+            print(f"CHALLENGER ERROR: {e}")
+        finally:
+            with cls._pending_lock:
+                cls._pending -= 1
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        stats = {
+            "agreement_baseline": "full champion model",
+            "champion": {
+                endpoint: s.summary(is_champion=True)
+                for endpoint, s in list(cls._champion_stats.items())
+            }
+        }
+        stats.update({
+            name: s.summary()
+            for name, s in list(cls._stats.items())
+        })
+        if cls._fast_model is not None:
+            with cls._fast_lock:
+                stats["fast_path"] = {
+                    "records": cls._fast_records,
+                    "fallback_rate": round(cls._fast_fallbacks / cls._fast_records, 4) if cls._fast_records else None
+                }
+        return stats
@@ -0,0 +1,81 @@
+"""
+Benchmark: champion request latency with challengers idle vs shadow-scoring.
+
+Measures the full served path of POST /predict (Pydantic validation, feature
+engineering, threadpool, background task hand-off) through the ASGI app, so
+GIL contention with the challenger thread shows up in the numbers.
+TestClient waits for background tasks, so each timing also includes the
+(enqueue-only) challenger hand-off. Requires httpx for TestClient.
+
+Three modes: no challengers at all, then interleaved blocks of challengers
+idle (registered, CHALLENGER_SAMPLE_RATE=0) and running (rate 1), so drift
+over the run affects idle and running equally.
+
+Run from the repo root (leave MULTI_MODEL_MODE unset; challengers are added here):
+    python -m backend.benchmark_challengers [n_requests]
+
+If no challenger artifact is found, a second copy of the champion is used
+as a stand-in so the interference can still be measured.
+"""
+import os
+import sys
+import time
+import joblib
+import numpy as np
+from fastapi.testclient import TestClient
+
+from backend.app.config import settings
+from backend.app.main import app, API_SECRET
+from backend.app.services.model_loader import ModelLoader
+from backend.benchmark_compact import make_payloads
+
+HEADERS = {"X-Service-Token": API_SECRET, "Content-Type": "application/json"}
+
+
+def request_latencies(client, payloads):
+    """
+    Client-observed latency (ms) of POST /predict, one request at a time.
+    """
+    latencies = []
+    for body in payloads:
+        start = time.perf_counter()
+        response = client.post("/predict", content=body, headers=HEADERS)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return np.array(latencies)
+
+
+def run(n=2000, block=250):
+    if settings.MULTI_MODEL_MODE:
+        sys.exit("Unset MULTI_MODEL_MODE: the baseline must run without challengers.")
+
+    payloads = make_payloads(n)
+    # localhost passes the TrustedHost middleware
+    with TestClient(app, base_url="http://localhost") as client:
+        request_latencies(client, payloads[:200])  # Warmup
+        baseline = request_latencies(client, payloads)
+
+        if not ModelLoader.load_challengers():
+            print("No challenger artifacts found - using a champion copy as stand-in.")
+            ModelLoader.add_challenger("champion_copy", joblib.load(settings.MODEL_PATH))
+
+        # Interleave idle / running blocks so drift hits both equally.
+        # Idle = challengers registered but sampled out (rate 0).
+        idle, running = [], []
+        for i in range(0, n, block):
+            for rate, bucket in ((0.0, idle), (1.0, running)):
+                settings.CHALLENGER_SAMPLE_RATE = rate
+                bucket.append(request_latencies(client, payloads[i:i + block]))
+        idle, running = np.concatenate(idle), np.concatenate(running)
+    # Leaving the client runs the shutdown event, which drains the challenger queue
+
+    print(f"Requests: {n} per mode  (cpus: {os.cpu_count()})")
+    print(f"{'POST /predict':<24}{'p50 ms':>10}{'p99 ms':>10}")
+    for label, lat in (("no challengers", baseline), ("challengers idle", idle), ("challengers running", running)):
+        print(f"{label:<24}{np.percentile(lat, 50):>10.3f}{np.percentile(lat, 99):>10.3f}")
+    for name, summary in ModelLoader.get_stats().items():
+        print(f"{name}: {summary}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,111 @@
+"""
+Benchmark: JSON /predict path vs compact binary path.
+
+Run from the repo root:
+    python -m backend.benchmark_compact [n_records]
+"""
+import json
+import sys
+import time
+import numpy as np
+from datetime import datetime, timedelta
+
+from backend.app.schemas import AccidentInput
+from backend.app.services.model_loader import ModelLoader
+from backend.app.services.feature_engineering import feature_engine
+from backend.app.services.compact_input import compact_decoder, encode_records
+
+WEATHERS = ["Clear", "Light Rain", "Overcast", "Heavy Snow", "Fog", "Thunderstorm", "Scattered Clouds"]
+WINDS = ["Calm", "N", "NW", "WSW", "VAR", "SSE", "E", "North"]
+DESCRIPTIONS = [
+    "Accident on I-95 North. Queueing traffic.",
+    "Lane blocked due to crash at exit 12",
+    "Debris on road, caution advised",
+    "Slow traffic on Main St",
+    "Vehicle fire reported near ramp",
+]
+POIS = ["Amenity", "Crossing", "Give_Way", "Junction", "Railway", "Station", "Stop", "Traffic_Signal"]
+
+
+def make_payloads(n, seed=42):
+    """
+    Synthetic JSON bodies covering every categorical branch.
+    """
+    rng = np.random.default_rng(seed)
+    base = datetime(2022, 3, 1)
+    payloads = []
+    for _ in range(n):
+        payload = {
+            "Start_Time": (base + timedelta(minutes=int(rng.integers(0, 525600)))).isoformat(sep=" "),
+            "Description": DESCRIPTIONS[rng.integers(len(DESCRIPTIONS))],
+            "Street": "I-95 N",
+            "Weather_Condition": WEATHERS[rng.integers(len(WEATHERS))],
+            "Temperature(F)": float(rng.uniform(-10, 100)),
+            "Humidity(%)": float(rng.uniform(10, 100)),
+            "Pressure(in)": float(rng.uniform(28.5, 30.5)),
+            "Visibility(mi)": float(rng.uniform(0, 10)),
+            "Wind_Speed(mph)": float(rng.uniform(0, 40)),
+            "Precipitation(in)": float(rng.exponential(0.05)),
+            "Wind_Direction": WINDS[rng.integers(len(WINDS))],
+        }
+        for p in POIS:
+            payload[p] = bool(rng.random() < 0.2)
+        payloads.append(json.dumps(payload))
+    return payloads
+
+
+def timed(fn, repeats=5):
+    """
+    Best-of-N wall time in seconds (and the last result).
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(n=1000):
+    ModelLoader.load_models()
+    model = ModelLoader.get_model()
+    payloads = make_payloads(n)
+    inputs = [AccidentInput(**json.loads(p)) for p in payloads]
+
+    # 1. JSON path, one request per record (what clients do today)
+    def json_path():
+        out = []
+        for body in payloads:
+            features = feature_engine.transform(AccidentInput(**json.loads(body)))
+            out.append(model.predict_proba(features)[0][1])
+        return np.array(out)
+
+    def json_decode_only():
+        return [feature_engine.transform(AccidentInput(**json.loads(body))) for body in payloads]
+
+    json_t, json_probs = timed(json_path)
+    json_dec_t, _ = timed(json_decode_only)
+
+    print(f"Records: {n}")
+    print(f"{'path':<28}{'decode us/rec':>16}{'total us/rec':>16}")
+    print(f"{'json (1 per request)':<28}{json_dec_t / n * 1e6:>16.1f}{json_t / n * 1e6:>16.1f}")
+
+    # 2. Compact path at several batch sizes
+    for batch in (1, 32, 256, 1024):
+        bodies = [encode_records(inputs[i:i + batch]) for i in range(0, n, batch)]
+
+        def compact_path():
+            return np.concatenate([model.predict_proba(compact_decoder.transform(b))[:, 1] for b in bodies])
+
+        def compact_decode_only():
+            return [compact_decoder.transform(b) for b in bodies]
+
+        compact_t, compact_probs = timed(compact_path)
+        compact_dec_t, _ = timed(compact_decode_only)
+        label = f"compact (batch={batch})"
+        print(f"{label:<28}{compact_dec_t / n * 1e6:>16.1f}{compact_t / n * 1e6:>16.1f}"
+              f"   max |dp| vs json = {np.abs(compact_probs - json_probs).max():.2e}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
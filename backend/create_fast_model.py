@@ -0,0 +1,184 @@
+"""
+Builds the fast-path model by truncating the tuned LightGBM booster to its
+first K iterations, and writes an accuracy-versus-latency report.
+
+The validation CSV needs the raw AccidentInput columns (Start_Time, Description,
+Weather_Condition, Temperature(F), ...) plus a 0/1 label column (1 = Severe).
+
+Run from the repo root:
+    python -m backend.create_fast_model --validation path/to/validation.csv
+"""
+import argparse
+import json
+import time
+import numpy as np
+import pandas as pd
+import lightgbm as lgb
+
+from backend.app.config import settings
+from backend.app.schemas import AccidentInput
+from backend.app.services.model_loader import ModelLoader
+from backend.app.services.feature_engineering import feature_engine
+
+INPUT_COLS = [
+    'Start_Time', 'Description', 'Weather_Condition', 'Temperature(F)', 'Humidity(%)',
+    'Pressure(in)', 'Visibility(mi)', 'Wind_Speed(mph)', 'Precipitation(in)', 'Wind_Direction',
+    'Amenity', 'Bump', 'Crossing', 'Give_Way', 'Junction', 'No_Exit', 'Railway', 'Roundabout',
+    'Station', 'Stop', 'Traffic_Calming', 'Traffic_Signal', 'Turning_Loop'
+]
+REQUIRED_COLS = INPUT_COLS[:8]
+
+
+def load_validation(path, label_col):
+    """
+    Validation CSV -> (Scaled Features (N, 54), Labels (N,)) via the serving pipeline.
+    """
+    df = pd.read_csv(path)
+    if label_col not in df.columns:
+        raise ValueError(f"Label column '{label_col}' not found in {path}")
+
+    df = df.dropna(subset=REQUIRED_COLS + [label_col])
+    df = df[[c for c in INPUT_COLS if c in df.columns] + [label_col]]
+    df = df.fillna({'Precipitation(in)': 0.0, 'Wind_Direction': 'Calm'})
+    df = df.fillna({c: False for c in INPUT_COLS[10:] if c in df.columns})
+
+    # Row-by-row through the JSON path's engineer (no Description truncation)
+    records = df[[c for c in INPUT_COLS if c in df.columns]].to_dict('records')
+    X = np.vstack([feature_engine.transform(AccidentInput(**rec)) for rec in records])
+    return X, df[label_col].astype(int).to_numpy()
+
+
+def recall_precision(y, probs):
+    pred = probs >= settings.DECISION_THRESHOLD
+    tp = int((pred & (y == 1)).sum())
+    recall = tp / max(int((y == 1).sum()), 1)
+    precision = tp / max(int(pred.sum()), 1)
+    return recall, precision
+
+
+def latency_ms(predict, X, n_single=500):
+    """
+    Single-record p50/p99 and full-batch per-record latency, in ms.
+    """
+    single = []
+    for i in range(min(n_single, len(X))):
+        start = time.perf_counter()
+        predict(X[i:i + 1])
+        single.append((time.perf_counter() - start) * 1000)
+    start = time.perf_counter()
+    predict(X)
+    batch = (time.perf_counter() - start) * 1000 / len(X)
+    return float(np.percentile(single, 50)), float(np.percentile(single, 99)), batch
+
+
+def evaluate(name, predict, X, y, full_labels):
+    probs = predict(X)
+    recall, precision = recall_precision(y, probs)
+    # Share of rows labelled the same as the full model
+    agreement = float(((probs >= settings.DECISION_THRESHOLD) == full_labels).mean())
+    p50, p99, batch = latency_ms(predict, X)
+    return {
+        "model": name, "recall": recall, "precision": precision, "agreement": agreement,
+        "p50_ms": p50, "p99_ms": p99, "batch_ms_per_record": batch
+    }
+
+
+def write_report(rows, n_records, chosen, max_recall_drop, max_precision_drop, path):
+    lines = [
+        "# Fast-Path Model Report",
+        "",
+        f"Validation records: {n_records}. Threshold: {settings.DECISION_THRESHOLD}. "
+        f"Fallback band: +/-{settings.FAST_MODEL_BAND}. "
+        f"Budget: recall drop <= {max_recall_drop}, precision drop <= {max_precision_drop}.",
+        "All models are timed through the raw LightGBM Booster.predict (as served).",
+        "",
+        "| Model | Recall | Precision | Agreement | Fallback Rate | p50 ms | p99 ms | Batch ms/record |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    for r in rows:
+        fallback = f"{r['fallback_rate']:.2%}" if 'fallback_rate' in r else "-"
+        lines.append(
+            f"| {r['model']} | {r['recall']:.4f} | {r['precision']:.4f} | {r['agreement']:.4f} | {fallback} | "
+            f"{r['p50_ms']:.3f} | {r['p99_ms']:.3f} | {r['batch_ms_per_record']:.4f} |"
+        )
+    lines += ["", f"Selected: {chosen or 'none (no candidate met the recall/precision budget)'}", ""]
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+    with open(str(path).replace(".md", ".json"), "w") as f:
+        # Band and threshold are what the recall numbers were measured under;
+        # ModelLoader warns if the serving config differs.
+        json.dump({
+            "selected": chosen,
+            "decision_threshold": settings.DECISION_THRESHOLD,
+            "fast_model_band": settings.FAST_MODEL_BAND,
+            "max_recall_drop": max_recall_drop,
+            "max_precision_drop": max_precision_drop,
+            "results": rows
+        }, f, indent=2)
+
+
+def create_fast_model(validation, label_col, iterations, max_recall_drop, max_precision_drop):
+    ModelLoader.load_models()
+    model = ModelLoader.get_model()
+    booster = model.booster_
+    # Served iterations (best_iteration_ if early stopping was used)
+    total = getattr(model, "best_iteration_", None) or booster.current_iteration()
+    iterations = sorted(k for k in (iterations or [total // 4, total // 2]) if 0 < k < total)
+
+    print(f"Loading validation data from {validation}...")
+    X, y = load_validation(validation, label_col)
+    print(f"Scoring {len(X)} records (full model: {total} iterations)...")
+
+    # Same call as ModelLoader serves (raw booster), so the latency
+    # comparison measures truncation, not the sklearn wrapper
+    def full_predict(A):
+        return booster.predict(A, num_iteration=total)
+
+    full_labels = full_predict(X) >= settings.DECISION_THRESHOLD
+    full = evaluate(f"full ({total} iters)", full_predict, X, y, full_labels)
+    rows = [full]
+    chosen = None
+
+    for k in iterations:
+        fast = lgb.Booster(model_str=booster.model_to_string(num_iteration=k))
+
+        def routed(A, fast=fast):
+            probs = fast.predict(A)
+            borderline = np.abs(probs - settings.DECISION_THRESHOLD) < settings.FAST_MODEL_BAND
+            if borderline.any():
+                probs[borderline] = full_predict(A[borderline])
+            return probs
+
+        rows.append(evaluate(f"truncated ({k} iters)", fast.predict, X, y, full_labels))
+        fast_probs = fast.predict(X)
+        row = evaluate(f"truncated ({k} iters) + fallback", routed, X, y, full_labels)
+        row["fallback_rate"] = float((np.abs(fast_probs - settings.DECISION_THRESHOLD) < settings.FAST_MODEL_BAND).mean())
+        rows.append(row)
+
+        # Smallest K whose served (routed) recall AND precision stay within budget.
+        # Recall alone would pass any candidate that simply flags more rows Severe.
+        within_budget = (full["recall"] - row["recall"] <= max_recall_drop
+                         and full["precision"] - row["precision"] <= max_precision_drop)
+        if chosen is None and within_budget:
+            chosen = k
+            booster.save_model(str(settings.FAST_MODEL_PATH), num_iteration=k)
+            print(f"Saved fast model ({k} iterations) to {settings.FAST_MODEL_PATH}")
+
+    if chosen is None and settings.FAST_MODEL_PATH.exists():
+        # Never leave an older fast model live when this run selected none
+        settings.FAST_MODEL_PATH.unlink()
+        print(f"No candidate met the recall/precision budget. Removed stale {settings.FAST_MODEL_PATH}")
+
+    write_report(rows, len(X), chosen, max_recall_drop, max_precision_drop, settings.FAST_MODEL_REPORT_PATH)
+    print(f"Report written to {settings.FAST_MODEL_REPORT_PATH}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--validation", required=True, help="Local validation CSV")
+    parser.add_argument("--label-col", default="Binary_Severity", help="0/1 label column (1 = Severe)")
+    parser.add_argument("--iterations", type=int, nargs="*", help="Candidate K values (default: 1/4 and 1/2 of full)")
+    parser.add_argument("--max-recall-drop", type=float, default=0.005, help="Allowed recall loss vs full model")
+    parser.add_argument("--max-precision-drop", type=float, default=0.01, help="Allowed precision loss vs full model")
+    args = parser.parse_args()
+    create_fast_model(args.validation, args.label_col, args.iterations, args.max_recall_drop, args.max_precision_drop)
@@ -0,0 +1,96 @@
+"""
+Parity tests: compact binary path vs JSON (Pydantic + FeatureEngineer) path.
+
+Run from the repo root:
+    python -m pytest backend/tests
+"""
+import joblib
+import numpy as np
+import pytest
+
+from backend.app.config import settings
+from backend.app.schemas import AccidentInput
+from backend.app.services.model_loader import ModelLoader
+from backend.app.services.feature_engineering import FeatureEngineer, feature_engine
+from backend.app.services.compact_input import (
+    COMPACT_DTYPE, WIND_DIRECTION_CODES, compact_decoder, encode_records
+)
+
+# Raw conditions hitting every simplified weather bucket
+WEATHERS = ["Fair", "Overcast", "Haze", "Light Rain", "Light Freezing Drizzle", "Thunderstorm"]
+# Calm, an unknown direction, a lower-case one, and every scaler direction
+WINDS = ["Calm", "North", "var"] + list(WIND_DIRECTION_CODES[1:])
+START_TIMES = [
+    "2023-03-15 08:30:00",
+    "1955-07-04 23:15:00",          # pre-1970 (negative epoch seconds)
+    "2022-12-31T20:45:00+05:00",    # timezone-aware, JSON path uses wall-clock hour
+    "2023-06-01T02:00:00-07:00",
+]
+DESCRIPTIONS = [
+    "Accident on I-95 North. Queueing traffic.",
+    "Lane blocked due to crash at exit 12",
+    "Debris on road, caution advised",
+    "Vehicle fire reported near ramp",
+    "Heavy congestion",
+]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def scaler():
+    # Only the scaler is needed for feature parity
+    if ModelLoader._scaler is None:
+        ModelLoader._scaler = joblib.load(settings.SCALER_PATH)
+
+
+def make_input(i, **overrides):
+    payload = {
+        "Start_Time": START_TIMES[i % len(START_TIMES)],
+        "Description": DESCRIPTIONS[i % len(DESCRIPTIONS)],
+        "Weather_Condition": WEATHERS[i % len(WEATHERS)],
+        "Temperature(F)": [-5.0, 30.0, 49.9, 72.5][i % 4],
+        "Humidity(%)": 60.0 + i % 40,
+        "Pressure(in)": 29.9,
+        "Visibility(mi)": 10.0 - i % 10,
+        "Wind_Speed(mph)": [0.0, 3.0, 12.5, 35.0][(i // 4) % 4],
+        "Precipitation(in)": [0.0, 0.02, 0.5][i % 3],
+        "Wind_Direction": WINDS[i % len(WINDS)],
+    }
+    payload.update(overrides)
+    return AccidentInput(**payload)
+
+
+def build_inputs():
+    inputs = [make_input(i) for i in range(len(WINDS) * 2)]
+    # Each POI flag on its own (including Bump, which the scaler drops)
+    for p in FeatureEngineer.POI_COLS + ["Bump"]:
+        inputs.append(make_input(len(inputs), **{p: True}))
+    return inputs
+
+
+def test_compact_matches_json_path():
+    inputs = build_inputs()
+    expected = np.vstack([feature_engine.transform(item) for item in inputs])
+    actual = compact_decoder.transform(encode_records(inputs))
+    assert actual.shape == expected.shape
+    assert np.allclose(actual, expected)
+
+
+def test_encode_rejects_long_description():
+    item = make_input(0, Description="lanes " * 40)
+    with pytest.raises(ValueError):
+        encode_records([item])
+
+
+@pytest.mark.parametrize("start_time", [np.iinfo(np.int64).min, np.iinfo(np.int64).max])
+def test_decode_rejects_out_of_range_start_time(start_time):
+    records = np.frombuffer(encode_records([make_input(0)]), dtype=COMPACT_DTYPE).copy()
+    records['start_time'] = start_time
+    with pytest.raises(ValueError):
+        compact_decoder.decode(records.tobytes())
+
+
+def test_decode_rejects_invalid_utf8():
+    records = np.frombuffer(encode_records([make_input(0)]), dtype=COMPACT_DTYPE).copy()
+    records['description'] = b"Accident \xff\xfe on ramp"
+    with pytest.raises(ValueError):
+        compact_decoder.decode(records.tobytes())
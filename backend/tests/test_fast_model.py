@@ -0,0 +1,145 @@
+"""
+Fast-path model tests: band routing in ModelLoader.predict_severe and the
+create_fast_model selection / stale-artifact handling.
+
+Run from the repo root:
+    python -m pytest backend/tests
+"""
+import json
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.config import settings
+from backend.app.services.model_loader import ModelLoader
+from backend.benchmark_compact import make_payloads
+from backend.create_fast_model import create_fast_model
+
+
+class FirstColumnBooster:
+    """
+    Fake booster: P(Severe) is feature column 0. Records every batch it scores.
+    """
+    def __init__(self, constant=None):
+        self.constant = constant
+        self.calls = []
+
+    def predict(self, features, **kwargs):
+        self.calls.append(features.copy())
+        if self.constant is not None:
+            return np.full(len(features), self.constant)
+        return features[:, 0].copy()
+
+
+class FakeClassifier:
+    def __init__(self, booster):
+        self.booster_ = booster
+
+
+@pytest.fixture
+def fast_loader(monkeypatch):
+    full = FirstColumnBooster(constant=0.99)
+    monkeypatch.setattr(ModelLoader, "_model", FakeClassifier(full))
+    monkeypatch.setattr(ModelLoader, "_fast_model", FirstColumnBooster())
+    monkeypatch.setattr(ModelLoader, "_fast_records", 0)
+    monkeypatch.setattr(ModelLoader, "_fast_fallbacks", 0)
+    monkeypatch.setattr(settings, "DECISION_THRESHOLD", 0.5)
+    monkeypatch.setattr(settings, "FAST_MODEL_BAND", 0.1)
+    return full
+
+
+def test_only_borderline_rows_fall_back(fast_loader):
+    features = np.zeros((5, 54))
+    features[:, 0] = [0.05, 0.45, 0.55, 0.95, 0.39]
+
+    probs = ModelLoader.predict_severe(features)
+
+    # Rows 1 and 2 are within 0.1 of the threshold and re-scored by the full model
+    assert np.allclose(probs, [0.05, 0.99, 0.99, 0.95, 0.39])
+    assert len(fast_loader.calls) == 1
+    assert np.allclose(fast_loader.calls[0][:, 0], [0.45, 0.55])
+    assert ModelLoader._fast_records == 5
+    assert ModelLoader._fast_fallbacks == 2
+
+
+def test_no_borderline_rows_skip_full_model(fast_loader):
+    features = np.zeros((3, 54))
+    features[:, 0] = [0.01, 0.2, 0.9]
+
+    ModelLoader.predict_severe(features)
+
+    assert fast_loader.calls == []
+    assert ModelLoader.get_stats()["fast_path"] == {"records": 3, "fallback_rate": 0.0}
+
+
+def test_full_path_matches_predict_proba(monkeypatch):
+    monkeypatch.setattr(ModelLoader, "_fast_model", None)
+    model = ModelLoader.get_model()
+    features = np.random.default_rng(0).normal(size=(64, 54))
+    assert np.array_equal(ModelLoader.predict_severe(features), model.predict_proba(features)[:, 1])
+
+
+@pytest.fixture
+def validation_csv(tmp_path):
+    rows = [json.loads(p) for p in make_payloads(80, seed=7)]
+    labels = np.random.default_rng(7).integers(0, 2, size=len(rows))
+    df = pd.DataFrame(rows)
+    df["Binary_Severity"] = labels
+    path = tmp_path / "validation.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def artifact_paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "FAST_MODEL_PATH", tmp_path / "lgbm_fast_model.txt")
+    monkeypatch.setattr(settings, "FAST_MODEL_REPORT_PATH", tmp_path / "fast_model_report.md")
+    return settings.FAST_MODEL_PATH, settings.FAST_MODEL_REPORT_PATH.with_suffix(".json")
+
+
+def test_stale_fast_model_removed_when_none_qualifies(validation_csv, artifact_paths):
+    model_path, report_path = artifact_paths
+    model_path.write_text("stale booster from an earlier run")
+
+    # Negative budgets: no candidate can qualify
+    create_fast_model(validation_csv, "Binary_Severity", [10], -1.0, -1.0)
+
+    assert not model_path.exists()
+    report = json.loads(report_path.read_text())
+    assert report["selected"] is None
+    assert report["fast_model_band"] == settings.FAST_MODEL_BAND
+    assert report["max_precision_drop"] == -1.0
+
+
+def test_precision_budget_blocks_selection(validation_csv, artifact_paths):
+    model_path, report_path = artifact_paths
+
+    # Unlimited recall budget, but precision may not drop at all vs the full model
+    create_fast_model(validation_csv, "Binary_Severity", [1], 1.0, -1.0)
+    assert not model_path.exists()
+
+    create_fast_model(validation_csv, "Binary_Severity", [1], 1.0, 1.0)
+    assert model_path.exists()
+    report = json.loads(report_path.read_text())
+    assert report["selected"] == 1
+    assert all("agreement" in row for row in report["results"])
+
+
+def test_challenger_agreement_uses_full_champion(monkeypatch):
+    # Fast path on: served probabilities are not the champion's, so the
+    # worker must re-score the full champion for the agreement baseline
+    model = ModelLoader.get_model()
+    monkeypatch.setattr(ModelLoader, "_fast_model", FirstColumnBooster())
+    monkeypatch.setattr(ModelLoader, "_challengers", {})
+    monkeypatch.setattr(ModelLoader, "_stats", {})
+    monkeypatch.setattr(ModelLoader, "_executor", None)
+    monkeypatch.setattr(ModelLoader, "_pending", 0)
+
+    features = np.random.default_rng(1).normal(size=(16, 54))
+    served = 1.0 - model.predict_proba(features)[:, 1]  # Deliberately disagrees
+
+    ModelLoader.add_challenger("copy", model)
+    ModelLoader.submit_challengers(features, served)
+    ModelLoader.shutdown_challengers(wait=True)
+
+    assert ModelLoader.get_stats()["copy"]["agreement_rate"] == 1.0
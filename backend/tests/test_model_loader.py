@@ -0,0 +1,97 @@
+"""
+ModelLoader multi-model tests: stats bookkeeping, load shedding and the
+out-of-process challenger pool.
+
+Run from the repo root:
+    python -m pytest backend/tests
+"""
+import joblib
+import numpy as np
+import pytest
+
+from backend.app.config import settings
+from backend.app.services.model_loader import ModelLoader, ModelStats
+
+
+@pytest.fixture
+def isolated_loader(monkeypatch):
+    # Fresh challenger state per test; monkeypatch restores the class attributes
+    monkeypatch.setattr(ModelLoader, "_challengers", {})
+    monkeypatch.setattr(ModelLoader, "_stats", {})
+    monkeypatch.setattr(ModelLoader, "_champion_stats", {})
+    monkeypatch.setattr(ModelLoader, "_executor", None)
+    monkeypatch.setattr(ModelLoader, "_pending", 0)
+    yield ModelLoader
+    ModelLoader.shutdown_challengers(wait=True)
+
+
+def test_model_stats_agreement_and_drops():
+    stats = ModelStats(window=10)
+    stats.record(2.0, n=4, agreed=3)
+    stats.record(4.0, n=6, agreed=6)
+    stats.record_drop()
+    stats.record_drop()
+
+    summary = stats.summary()
+    assert summary["scored"] == 10
+    assert summary["agreement_rate"] == 0.9
+    assert summary["dropped"] == 2
+    assert summary["latency_p50_ms"] == 3.0
+
+    champion = stats.summary(is_champion=True)
+    assert "agreement_rate" not in champion and "dropped" not in champion
+
+
+def test_model_stats_window_is_bounded():
+    stats = ModelStats(window=3)
+    for latency in (100.0, 1.0, 1.0, 1.0):
+        stats.record(latency)
+    assert stats.summary(is_champion=True)["latency_p99_ms"] == 1.0
+
+
+def test_submit_sheds_load_at_max_pending(isolated_loader, monkeypatch):
+    monkeypatch.setattr(settings, "CHALLENGER_MAX_PENDING", 2)
+    isolated_loader._challengers = {"a": object(), "b": object()}
+    isolated_loader._stats = {"a": ModelStats(10), "b": ModelStats(10)}
+    isolated_loader._pending = 2
+
+    isolated_loader.submit_challengers(np.zeros((1, 54)), np.array([0.7]))
+
+    assert isolated_loader._pending == 2
+    assert isolated_loader._stats["a"].dropped == 1
+    assert isolated_loader._stats["b"].dropped == 1
+
+
+def test_submit_after_shutdown_releases_pending(isolated_loader):
+    # Challengers registered but the pool already shut down (late background task)
+    isolated_loader._challengers = {"a": object()}
+    isolated_loader._stats = {"a": ModelStats(10)}
+
+    isolated_loader.submit_challengers(np.zeros((1, 54)), np.array([0.7]))
+
+    assert isolated_loader._pending == 0
+    assert isolated_loader._stats["a"].scored == 0
+
+
+def test_champion_stats_are_kept_per_endpoint(isolated_loader):
+    isolated_loader.record_champion(1.0)
+    isolated_loader.record_champion(50.0, n=1024, endpoint="/predict/compact")
+
+    champion = isolated_loader.get_stats()["champion"]
+    assert champion["/predict"]["latency_p99_ms"] == 1.0
+    assert champion["/predict/compact"]["scored"] == 1024
+
+
+def test_challenger_pool_scores_out_of_process(isolated_loader):
+    model = joblib.load(settings.MODEL_PATH)
+    features = np.random.default_rng(0).normal(size=(8, 54))
+    champion_probs = model.predict_proba(features)[:, 1]
+
+    isolated_loader.add_challenger("copy", model)
+    isolated_loader.submit_challengers(features, champion_probs)
+    isolated_loader.shutdown_challengers(wait=True)
+
+    summary = isolated_loader.get_stats()["copy"]
+    assert summary["scored"] == 8
+    assert summary["agreement_rate"] == 1.0
+    assert isolated_loader._pending == 0